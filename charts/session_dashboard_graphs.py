@@ -37,22 +37,26 @@ def rpe_boxplot_per_session(df: pd.DataFrame, title: str) -> go.Figure:
 
 def rpe_outliers_table(df: pd.DataFrame, iqr_k: float = 1.5) -> pd.DataFrame:
     """
-    IQR-based outliers per session.
+    IQR-based outliers per session, in the row order of `df`.
     Returns: date, session_type, session_id, player_id, rpe, lower_fence, upper_fence
     """
     if df.empty:
         return pd.DataFrame()
 
-    def _one(g: pd.DataFrame) -> pd.DataFrame:
-        q1, q3 = g["rpe"].quantile(0.25), g["rpe"].quantile(0.75)
-        iqr = q3 - q1
-        lower, upper = q1 - iqr_k * iqr, q3 + iqr_k * iqr
-        mask = (g["rpe"] < lower) | (g["rpe"] > upper)
-        out = g.loc[mask, ["date", "session_type", "session_id", "player_id", "rpe"]].copy()
-        out["lower_fence"], out["upper_fence"] = lower, upper
-        return out
-
-    return df.groupby("session_id", group_keys=False).apply(_one).reset_index(drop=True)
+    # quartiles for every session in one grouped pass, broadcast back to the rows
+    quartiles = (
+        df.groupby("session_id")["rpe"].quantile([0.25, 0.75]).unstack().reindex(columns=[0.25, 0.75])
+    )
+    q1 = df["session_id"].map(quartiles[0.25])
+    q3 = df["session_id"].map(quartiles[0.75])
+    iqr = q3 - q1
+    lower, upper = q1 - iqr_k * iqr, q3 + iqr_k * iqr
+
+    mask = (df["rpe"] < lower) | (df["rpe"] > upper)
+    out = df.loc[mask, ["date", "session_type", "session_id", "player_id", "rpe"]].assign(
+        lower_fence=lower[mask], upper_fence=upper[mask]
+    )
+    return out.reset_index(drop=True)
 
 
 # ---------- Your existing KPIs ----------
@@ -66,7 +70,7 @@ def bar_avg_load_per_type(agg_df: pd.DataFrame, title: str) -> go.Figure:
 
     df = agg_df.copy()
     df["avg_load_per_session"] = df["total_load"] / df["session_count"]
-    type_df = df.groupby("session_type", as_index=False)["avg_load_per_session"].mean()
+    type_df = df.groupby("session_type", as_index=False, observed=True)["avg_load_per_session"].mean()
 
     return px.bar(
         type_df, x="session_type", y="avg_load_per_session",
@@ -100,22 +104,23 @@ def stacked_pct_load_per_week(agg_df: pd.DataFrame, title: str) -> go.Figure:
     if agg_df.empty:
         return go.Figure()
 
-    stacked_df = agg_df.pivot(index="week", columns="session_type", values="total_load").fillna(0)
-    stacked_df["total"] = stacked_df.sum(axis=1)
-    pct = stacked_df.div(stacked_df["total"], axis=0).drop(columns="total") * 100
-    pct = pct.reset_index().round(1)
-
-    melted = pct.melt(id_vars="week", var_name="Session Type", value_name="Percentage")
-
-    fig = px.bar(
-        melted,
-        x="week",
-        y="Percentage",
-        color="Session Type",
-        text="Percentage",
+    # share of each session type in its week, computed in long form (no pivot/melt)
+    long = agg_df.groupby(["week", "session_type"], as_index=False, observed=True)["total_load"].sum()
+    long["Percentage"] = (
+        long["total_load"] / long.groupby("week")["total_load"].transform("sum") * 100
+    ).round(1)
+
+    # one Bar trace per session type
+    fig = go.Figure([
+        go.Bar(name=str(stype), x=grp["week"], y=grp["Percentage"], text=grp["Percentage"])
+        for stype, grp in long.groupby("session_type", observed=True)
+    ])
+    fig.update_traces(texttemplate="%{text}%", textposition="inside")
+    fig.update_layout(
+        barmode="stack",
         title=title,
-        labels={"week": "Training Week"}
+        xaxis_title="Training Week",
+        yaxis_title="Percentage (%)",
+        legend_title_text="Session Type",
     )
-    fig.update_traces(texttemplate="%{text}%", textposition="inside")
-    fig.update_layout(barmode="stack", yaxis_title="Percentage (%)")
-    return fig
\ No newline at end of file
+    return fig
@@ -26,8 +26,8 @@ class BaseRepository:
         except Exception as e:
             raise DatabaseError(f"[{self.col.name}] update failed: {e}") from e
 
-    def bulk_write_safe(self, ops: Iterable[Any]):
+    def bulk_write_safe(self, ops: Iterable[Any], ordered: bool = True):
         try:
-            return self.col.bulk_write(list(ops))
+            return self.col.bulk_write(list(ops), ordered=ordered)
         except Exception as e:
             raise DatabaseError(f"[{self.col.name}] bulk_write failed: {e}") from e
\ No newline at end of file
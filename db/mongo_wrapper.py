@@ -13,7 +13,7 @@ Notes:
 from pymongo import MongoClient
 import pandas as pd
 from datetime import datetime, date, time
-from typing import List, Dict, Any, Optional, Set, Union
+from typing import List, Dict, Any, Optional, Set, Tuple, Union
 #from pymongo.collection import Collection
 #from pymongo import ASCENDING, DESCENDING
 from pymongo.errors import PyMongoError
@@ -55,10 +55,11 @@ class MongoWrapper:
         - Wrap pymongo errors as DatabaseError
 
     Indexes (recommended):
-        - roster: {player_id: 1}
+        - roster: {player_id: 1}  (created on init)
         - player_wellness: {timestamp: 1}, {player_id: 1, timestamp: 1}
         - player_rpe: {session_id: 1}, {player_id: 1}, {timestamp: 1}
         - sessions: {session_id: 1} (unique), {team: 1, weeknumber: 1}
+        - player_pdp: {player_id: 1, last_updated: -1}  (created on init)
     """
 
     # --------------------
@@ -79,6 +80,9 @@ class MongoWrapper:
         self.attendance_repo = AttendanceRepository(self.db)  # attendance repo
         self.session_dashboard_repo = SessionsDashboardRepository(self.db)  # session dashboard repo
 
+        # indexes for the hot read paths (idempotent, best-effort: failures are logged, never raised)
+        self.player_pdp_repo.ensure_indexes()
+        self.rpe_dash_repo.ensure_indexes()
 
 
     # -----------------------
@@ -109,6 +113,19 @@ class MongoWrapper:
 
 
 
+    def update_roster_rows(self, updates: List[Tuple[int, Dict[str, Any]]], *, team: str) -> int:
+        """Pass-through to RosterRepository.update_roster_rows() (changed fields only)."""
+        try:
+            if not team:
+                raise ApplicationError("update_roster_rows: 'team' is required in the team-scoped workflow.")
+            return self.roster_repo.update_roster_rows(updates=updates, team=team)
+        except (DatabaseError, ApplicationError):
+            raise
+        except Exception as e:
+            raise ApplicationError(f"mongo_wrapper.update_roster_rows unexpected error: {e}") from e
+
+
+
     def get_player_names(
         self,
         team: str,
@@ -265,9 +282,9 @@ class MongoWrapper:
     # Player PDP functions
     # ---------------------
 
-    def get_latest_pdp_for_player(self, player_id):
+    def get_latest_pdp_for_player(self, player_id, fields: Optional[List[str]] = None):
         try:
-            return self.player_pdp_repo.get_latest_pdp_for_player(player_id=player_id)
+            return self.player_pdp_repo.get_latest_pdp_for_player(player_id=player_id, fields=fields)
         except (DatabaseError, ApplicationError):
             raise
         except Exception as e:
@@ -27,6 +27,7 @@ from __future__ import annotations
 from datetime import datetime, date as date_type
 from typing import List, Dict, Any
 
+from pymongo import ReturnDocument
 from pymongo.errors import PyMongoError
 from db.errors import DatabaseError
 
@@ -136,7 +137,6 @@ class PlayerMeasurementsRepository:
             )
 
         now = datetime.utcnow()
-        date_iso = measurement_date.isoformat()
         measurement_id = f"{team}-{date_iso}"
 
         doc_filter = {"team": team, "date": date_iso}
@@ -156,8 +156,14 @@ class PlayerMeasurementsRepository:
         }
 
         try:
-            self.col.update_one(doc_filter, doc_update, upsert=True)
-            doc = self.col.find_one(doc_filter, {"_id": 1})
+            # Single round-trip: upsert the whole session and get its _id back.
+            doc = self.col.find_one_and_update(
+                doc_filter,
+                doc_update,
+                projection={"_id": 1},
+                upsert=True,
+                return_document=ReturnDocument.AFTER,
+            )
             return str(doc["_id"])
         except PyMongoError as e:
             raise DatabaseError(f"upsert_measurement_session failed: {e}") from e
\ No newline at end of file
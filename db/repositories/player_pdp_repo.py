@@ -1,11 +1,15 @@
 # db/repositories/player_pdp_repo.py
 from __future__ import annotations
-from datetime import datetime
+import logging
+from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional
+from pymongo.errors import PyMongoError
 
 from ..base import BaseRepository
 from ..errors import DatabaseError, ApplicationError
 
+logger = logging.getLogger(__name__)
+
 
 class PlayerPdpRepository(BaseRepository):
     """
@@ -26,13 +30,33 @@ class PlayerPdpRepository(BaseRepository):
 
 
 
+    # ---- Indexing ----
+    def ensure_indexes(self) -> None:
+        """Create the index backing `get_latest_pdp_for_player` (player_id, last_updated desc).
+
+        Best-effort: called on startup, so failures are logged instead of raised.
+        """
+        try:
+            self.col.create_index([("player_id", 1), ("last_updated", -1)])
+        except PyMongoError as e:
+            logger.warning("[%s] ensure_indexes skipped: %s", self.col.name, e)
+
+
     # ---- Read ----
-    def get_latest_pdp_for_player(self, *, player_id: int) -> Optional[Dict[str, Any]]:
-        """Return the most recent PDP for a player (by last_updated desc)."""
+    def get_latest_pdp_for_player(
+        self, *, player_id: int, fields: Optional[List[str]] = None
+    ) -> Optional[Dict[str, Any]]:
+        """Return the most recent PDP for a player (by last_updated desc).
+
+        Args:
+            player_id: Player id.
+            fields: Optional list of fields to return (projection); full document if None.
+        """
         if player_id is None:
             raise ApplicationError("get_latest_pdp_for_player: 'player_id' is required.")
+        projection = {f: 1 for f in fields} if fields else None
         try:
-            return self.col.find_one({"player_id": int(player_id)}, sort=[("last_updated", -1)])
+            return self.col.find_one({"player_id": int(player_id)}, projection, sort=[("last_updated", -1)])
         except Exception as e:
             raise DatabaseError(f"Failed to fetch latest PDP for player {player_id}: {e}") from e
         
@@ -72,7 +96,7 @@ class PlayerPdpRepository(BaseRepository):
 
         doc = dict(pdp_data)
         # normalize/ensure timestamps
-        now = datetime.utcnow()
+        now = datetime.now(timezone.utc)
         doc.setdefault("created_at", now)
         doc.setdefault("last_updated", now)
 
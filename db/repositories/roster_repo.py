@@ -1,6 +1,7 @@
 # db/repositories/roster_repo.py
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 import pandas as pd
+from pymongo import UpdateOne
 from ..base import BaseRepository
 from ..errors import DatabaseError, ApplicationError
 
@@ -171,4 +172,41 @@ class RosterRepository(BaseRepository):
             self.col.insert_many(records, ordered=True)
             return True
         except Exception as e:
-            raise DatabaseError(f"save_roster_team_df failed: {e}") from e
\ No newline at end of file
+            raise DatabaseError(f"save_roster_team_df failed: {e}") from e
+
+
+
+    def update_roster_rows(self, *, team: str, updates: List[Tuple[int, Dict[str, Any]]]) -> int:
+        """Update only the edited fields of the given roster players of a single team.
+
+        Notes:
+            - Each entry is matched on (`team`, `player_id`) and exactly its fields are `$set`
+              (a cleared cell arrives as `None` and is written as null).
+            - Players not listed in `updates` are left untouched (unlike `save_roster_df`).
+            - All updates are sent in one unordered `bulk_write` round-trip.
+
+        Args:
+            team: Team code; enforced on every update.
+            updates: `(player_id, {field: new_value})` pairs with only the changed fields.
+
+        Returns:
+            Number of documents modified.
+
+        Raises:
+            ApplicationError: If `updates` is malformed.
+            DatabaseError: If the MongoDB bulk write fails.
+        """
+        ops = []
+        try:
+            for player_id, fields in updates:
+                pid = int(player_id)
+                doc_set = {k: v for k, v in dict(fields).items() if k not in ("player_id", "team")}
+                doc_set["team"] = team
+                # player_id may be stored as int or str
+                ops.append(UpdateOne({"team": team, "player_id": {"$in": [pid, str(pid)]}}, {"$set": doc_set}))
+        except Exception as e:
+            raise ApplicationError(f"update_roster_rows: invalid updates: {e}") from e
+
+        if not ops:
+            return 0
+        return self.bulk_write_safe(ops, ordered=False).modified_count
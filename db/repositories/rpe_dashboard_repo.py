@@ -1,5 +1,6 @@
 # db/repositories/rpe_repo.py
 from __future__ import annotations
+import logging
 from typing import Any, Dict, List, Optional
 import pandas as pd
 from pymongo.errors import PyMongoError
@@ -7,6 +8,8 @@ from pymongo.errors import PyMongoError
 from ..base import BaseRepository
 from ..errors import DatabaseError, ApplicationError
 
+logger = logging.getLogger(__name__)
+
 
 class RpeDashboardRepository(BaseRepository):
     """Repository for RPE reads/aggregations (collection: 'player_rpe')."""
@@ -18,6 +21,22 @@ class RpeDashboardRepository(BaseRepository):
 
 
 
+    # ---------------- Indexing ----------------
+    def ensure_indexes(self) -> None:
+        """Index `roster.player_id`, a $lookup target of the RPE aggregations.
+
+        `sessions.session_id` (the other join target) is documented as a unique
+        index and is left to the admin, since duplicate ids would make it fail.
+
+        Best-effort: called on startup, so failures (e.g. an equivalent index
+        with other options already exists) are logged instead of raised.
+        """
+        try:
+            self.roster.create_index([("player_id", 1)])
+        except PyMongoError as e:
+            logger.warning("[roster] ensure_indexes skipped: %s", e)
+
+
     # ---------------- Aggregate weekly loads + A:C ratio ----------------
     def get_rpe_loads(self, *, team: Optional[str] = None) -> pd.DataFrame:
         """Aggregate weekly RPE loads per player.
@@ -134,8 +153,14 @@ class RpeDashboardRepository(BaseRepository):
         - training_minutes defaults to the session's duration when missing/zero.
         """
         try:
-            rpe_data = list(self.col.find({}, {"_id": 0}))
-            roster_data = list(self.roster.find({}, {"_id": 0}))
+            # project only the fields used below; filter the roster server-side
+            rpe_proj = {
+                "_id": 0, "player_id": 1, "session_id": 1, "date": 1,
+                "rpe_score": 1, "training_minutes": 1, "timestamp": 1,
+            }
+            roster_proj = {"_id": 0, "player_id": 1, "player_first_name": 1, "player_last_name": 1}
+            rpe_data = list(self.col.find({}, rpe_proj))
+            roster_data = list(self.roster.find({"team": team} if team else {}, roster_proj))
             sessions_data = list(self.sessions.find({}, {"_id": 0, "session_id": 1, "duration": 1}))
 
             if not roster_data:
@@ -148,8 +173,6 @@ class RpeDashboardRepository(BaseRepository):
             # roster normalization
             roster_df["player_id"] = pd.to_numeric(roster_df["player_id"], errors="coerce").astype("Int64")
             roster_df["player_name"] = roster_df["player_last_name"].astype(str) + ", " + roster_df["player_first_name"].astype(str)
-            if team:
-                roster_df = roster_df[roster_df["team"] == team]
 
             if rpe_df.empty:
                 # Return player index (no date cols)
@@ -109,7 +109,9 @@ class SessionsDashboardRepository:
                     "session_type": "$session.session_type",
                     "duration": "$session.duration"
                 }},
-                {"$match": {"rpe": {"$ne": None}, "date": {"$ne": None}}}
+                {"$match": {"rpe": {"$ne": None}, "date": {"$ne": None}}},
+                # display order for the boxplot / outliers table, done server-side
+                {"$sort": {"date": 1, "session_type": 1, "session_id": 1, "player_id": 1}},
             ]
 
             rows = list(self.mongo.db["player_rpe"].aggregate(pipeline))
@@ -33,17 +33,21 @@ class WellnessDashboardRepository(BaseRepository):
         end_ts = datetime.combine(target_date, time.max)
 
         try:
-            # fetch player_ids for team (minimal projection)
-            player_ids = [int(d["player_id"]) for d in self.roster.find({"team": team}, {"_id": 0, "player_id": 1})]
-            if not player_ids:
-                return []
-
-            return list(
-                self.col.find(
-                    {"player_id": {"$in": player_ids}, "timestamp": {"$gte": start_ts, "$lte": end_ts}},
-                    {"_id": 0},
-                )
-            )
+            # one round-trip: today's entries joined to the roster to keep only `team`
+            # (roster ids may be stored as int or str, so match on both forms)
+            pipeline: List[Dict[str, Any]] = [
+                {"$match": {"timestamp": {"$gte": start_ts, "$lte": end_ts}}},
+                {"$addFields": {"_pid_keys": ["$player_id", {"$toString": "$player_id"}]}},
+                {"$lookup": {
+                    "from": self.roster.name,
+                    "localField": "_pid_keys",
+                    "foreignField": "player_id",
+                    "as": "_roster",
+                }},
+                {"$match": {"_roster.team": team}},
+                {"$project": {"_id": 0, "_pid_keys": 0, "_roster": 0}},
+            ]
+            return list(self.col.aggregate(pipeline))
         except PyMongoError as e:
             raise DatabaseError(f"Failed to fetch today's wellness entries: {e}") from e
         except Exception as e:
@@ -54,8 +54,7 @@ def season_rpe_quality(
 
     n_sessions = 0 if sessions.empty else len(sessions)
 
-    roster = mongo.get_roster_df()
-    roster = roster[roster["team"] == team].copy()
+    roster = mongo.get_roster_df(team=team)  # team filter runs server-side
     if roster.empty:
         roster = pd.DataFrame(columns=["player_id", "player_name"])
     else:
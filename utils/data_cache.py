@@ -0,0 +1,45 @@
+"""
+Cached lookups shared by several views.
+
+Streamlit reruns the whole page on every interaction. Roster and PDP structure
+rarely change, so they are fetched once per key and kept for a few minutes.
+The admin pages that edit them clear the matching cache after a successful save:
+    - Roster Management -> `load_roster.clear()`
+    - PDP Structure Management -> `load_pdp_structure.clear()`
+"""
+
+from typing import Any, Dict, List, Optional, Tuple
+
+import streamlit as st
+
+
+@st.cache_data(ttl=300, show_spinner=False)
+def load_roster(
+    _mongo,
+    team: str,
+    include_inactive: bool = False,
+) -> Tuple[List[Dict[str, Any]], Dict[int, str]]:
+    """Return the team's players and a player_id -> display name map.
+
+    Args:
+        _mongo: MongoWrapper instance (underscored so Streamlit does not hash it).
+        team: Team code (e.g., "U18", "U21").
+        include_inactive: Also return players flagged as inactive.
+
+    Returns:
+        (players, id_to_name) where `players` is the output of
+        `mongo.get_player_names(style="LAST_FIRST")`.
+    """
+    players = _mongo.get_player_names(team=team, style="LAST_FIRST", include_inactive=include_inactive)
+    return players, {p["player_id"]: p["display_name"] for p in players}
+
+
+@st.cache_data(ttl=300, show_spinner=False)
+def load_pdp_structure(_mongo, team: str) -> Optional[Dict[str, Any]]:
+    """Return the team's PDP structure document (or None if not found).
+
+    Args:
+        _mongo: MongoWrapper instance (underscored so Streamlit does not hash it).
+        team: Team code (e.g., "U18", "U21").
+    """
+    return _mongo.get_pdp_structure_for_team(team)
@@ -22,6 +22,7 @@ import streamlit as st
 from db.repositories.injury_repo import InjuryRepository
 from db.errors import DatabaseError
 from utils.team_selector import team_selector
+from utils.data_cache import load_roster
 from utils.constants import TEAMS
 
 
@@ -69,6 +70,59 @@ def _fmt_date(value: Any) -> str:
             return value  # return as-is if not parseable
     return str(value) if value not in (None, "", []) else "—"
 
+# --- helper: one injury card (fragment) ---------------------------------------
+
+@st.fragment
+def _render_injury_card(inj: Dict[str, Any], id_to_name: Dict[int, str], repo: InjuryRepository):
+    """Render a single injury expander; reruns are scoped to this card."""
+    player_name = id_to_name.get(inj.get("player_id"), f"#{inj.get('player_id')}")
+    desc = inj.get("description") or "—"
+    latest_status = repo.latest_status(inj)
+
+    header = (
+        f"**{player_name}** · {desc} · {latest_status}"
+    )
+
+    with st.expander(header, expanded=False):
+        # Combine comments list into string for details
+        raw_comments = inj.get("comments", [])
+        if isinstance(raw_comments, list):
+            comments_str = "\n".join(map(str, raw_comments))
+        else:
+            comments_str = str(raw_comments) if raw_comments else ""
+
+        # Format key injury dates before rendering
+        if inj.get("injury_date"):
+            inj["injury_date"] = _fmt_date(inj["injury_date"])
+        if inj.get("doctor_visit_date"):
+            inj["doctor_visit_date"] = _fmt_date(inj["doctor_visit_date"])
+
+        st.subheader(":material/assist_walker: Injury Details")
+        _render_injury_details_two_col(inj, comments_str=comments_str)
+
+        # Treatment sessions
+        st.subheader(":material/history: Treatment Sessions")
+        sessions: List[Dict[str, Any]] = inj.get("treatment_sessions", []) or []
+        if not sessions:
+            st.write("_No treatment sessions recorded yet._")
+        else:
+            try:
+                sessions = sorted(sessions, key=lambda s: s.get("session_date", ""), reverse=True)
+            except Exception:
+                pass
+
+            for s in sessions:
+                sd = _fmt_date(s.get("session_date", "—"))
+                author = s.get("created_by", "—")
+                comment = s.get("comment", "—")
+                status_after = s.get("status_after")
+                status_html = (
+                    f" · {status_after}"
+                    if status_after else ""
+                )
+                with st.expander(f"{sd} — {author}{status_html}", expanded=False):
+                    st.markdown(comment or "—")
+
 # --- main render --------------------------------------------------------------
 def render(mongo, user: str):
     st.title(":material/personal_injury: Injury Overview")
@@ -80,11 +134,10 @@ def render(mongo, user: str):
         return
 
     # Player lookup (player_id -> display name)
-    players = mongo.get_player_names(team=team, style="LAST_FIRST")
+    players, id_to_name = load_roster(mongo, team)
     if not players:
         st.warning("No players found in roster.", icon=":material/warning:")
         return
-    id_to_name = {p["player_id"]: p["display_name"] for p in players}
 
     # Fetch injuries for the team
     repo = InjuryRepository(mongo.db)
@@ -102,50 +155,4 @@ def render(mongo, user: str):
 
     # Render each injury in an expander
     for inj in injuries:
-        player_name = id_to_name.get(inj.get("player_id"), f"#{inj.get('player_id')}")
-        desc = inj.get("description") or "—"
-        latest_status = repo.latest_status(inj)
-
-        header = (
-            f"**{player_name}** · {desc} · {latest_status}"
-        )
-
-        with st.expander(header, expanded=False):
-            # Combine comments list into string for details
-            raw_comments = inj.get("comments", [])
-            if isinstance(raw_comments, list):
-                comments_str = "\n".join([str(c) for c in raw_comments]) if raw_comments else ""
-            else:
-                comments_str = str(raw_comments) if raw_comments else ""
-
-            # Format key injury dates before rendering
-            if inj.get("injury_date"):
-                inj["injury_date"] = _fmt_date(inj["injury_date"])
-            if inj.get("doctor_visit_date"):
-                inj["doctor_visit_date"] = _fmt_date(inj["doctor_visit_date"])
-
-            st.subheader(":material/assist_walker: Injury Details")
-            _render_injury_details_two_col(inj, comments_str=comments_str)
-
-            # Treatment sessions
-            st.subheader(":material/history: Treatment Sessions")
-            sessions: List[Dict[str, Any]] = inj.get("treatment_sessions", []) or []
-            if not sessions:
-                st.write("_No treatment sessions recorded yet._")
-            else:
-                try:
-                    sessions = sorted(sessions, key=lambda s: s.get("session_date", ""), reverse=True)
-                except Exception:
-                    pass
-
-                for s in sessions:
-                    sd = _fmt_date(s.get("session_date", "—"))
-                    author = s.get("created_by", "—")
-                    comment = s.get("comment", "—")
-                    status_after = s.get("status_after")
-                    status_html = (
-                        f" · {status_after}"
-                        if status_after else ""
-                    )
-                    with st.expander(f"{sd} — {author}{status_html}", expanded=False):
-                        st.markdown(comment or "—")
\ No newline at end of file
+        _render_injury_card(inj, id_to_name, repo)
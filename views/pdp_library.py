@@ -1,10 +1,45 @@
 import streamlit as st
-from datetime import datetime
+import pandas as pd
 from utils.pdf_utils import generate_pdp_pdf
 from utils.team_selector import team_selector
+from utils.data_cache import load_roster
 from utils.constants import TEAMS
 from db.mongo_wrapper import DatabaseError
 
+@st.fragment
+def _render_pdp_card(pdp, created_dt, selected_name):
+    """Render one archived PDP; reruns (e.g. the PDF download) are scoped to this card."""
+    created_by = pdp.get("created_by", "Unknown")
+    pdf_buffer = generate_pdp_pdf(pdp, selected_name)
+
+    with st.expander(f"📄 {created_dt.strftime('%Y-%m-%d')} — by {created_by}"):
+        st.download_button(
+            label=":material/download: Download as PDF",
+            data=pdf_buffer,
+            file_name=f"PDP_{selected_name.replace(', ', '_')}_{created_dt.date()}.pdf",
+            mime="application/pdf",
+            use_container_width=True
+        )
+
+        # Collapsed expanders are still serialized to the browser, so only build
+        # the score tables once the user asks for them (state persists via the key).
+        if not st.toggle("Show scores", key=f"pdp_show_{pdp['_id']}"):
+            return
+
+        for category, subcats in pdp["data"].items():
+            st.subheader(category)
+            for subcat, topics in subcats.items():
+                st.markdown(f"**{subcat}**")
+                rows = []
+                for topic, details in topics.items():
+                    rows.append({
+                        "Topic": topic,
+                        "Score": details["score"],
+                        "Priority": "✅" if details["priority"] else "",
+                        "Comment": details.get("comment", "")
+                    })
+                st.dataframe(rows, use_container_width=True, hide_index=True)
+
 def render(mongo, user):
     st.title(":material/folder: PDP Archive")
 
@@ -14,7 +49,7 @@ def render(mongo, user):
         return
     
     # --- Load roster ---
-    players = mongo.get_player_names(team=team, style="LAST_FIRST")
+    players, _ = load_roster(mongo, team)
     if not players:
         st.warning("No players found in roster.")
         return
@@ -32,36 +67,14 @@ def render(mongo, user):
         st.info("No PDPs found for this player.")
         return
 
-    # --- Sort by creation date descending ---
-    pdps = sorted(pdps, key=lambda x: x["created"], reverse=True)
+    # --- Parse creation dates once (ISO strings or BSON dates), sort descending ---
+    # ISO8601 accepts per-item precision (isoformat() drops zero microseconds);
+    # utc=True lets naive and offset-aware values share one timeline.
+    created = pd.to_datetime([p["created"] for p in pdps], format="ISO8601", utc=True)
+    pdps_by_date = sorted(zip(created, pdps), key=lambda x: x[0], reverse=True)
 
     # --- Display PDPs ---
     st.markdown(f"### PDPs for {selected_name}")
 
-    for i, pdp in enumerate(pdps):
-        created_dt = datetime.fromisoformat(pdp["created"])
-        created_by = pdp.get("created_by", "Unknown")
-        pdf_buffer = generate_pdp_pdf(pdp, selected_name)
-
-        with st.expander(f"📄 {created_dt.strftime('%Y-%m-%d')} — by {created_by}"):
-            st.download_button(
-                label=":material/download: Download as PDF",
-                data=pdf_buffer,
-                file_name=f"PDP_{selected_name.replace(', ', '_')}_{created_dt.date()}.pdf",
-                mime="application/pdf",
-                use_container_width=True
-            )
-
-            for category, subcats in pdp["data"].items():
-                st.subheader(category)
-                for subcat, topics in subcats.items():
-                    st.markdown(f"**{subcat}**")
-                    rows = []
-                    for topic, details in topics.items():
-                        rows.append({
-                            "Topic": topic,
-                            "Score": details["score"],
-                            "Priority": "✅" if details["priority"] else "",
-                            "Comment": details.get("comment", "")
-                        })
-                    st.dataframe(rows, use_container_width=True, hide_index=True)
\ No newline at end of file
+    for created_dt, pdp in pdps_by_date:
+        _render_pdp_card(pdp, created_dt, selected_name)
\ No newline at end of file
@@ -4,6 +4,7 @@ from copy import deepcopy
 import pandas as pd
 import uuid
 from utils.ui_utils import get_table_height
+from utils.data_cache import load_pdp_structure
 from utils.team_selector import team_selector
 from utils.constants import TEAMS
 
@@ -107,6 +108,7 @@ def render(mongo, user):
         }
         success = mongo.update_pdp_structure_for_team(team, updated_doc)
         if success:
+            load_pdp_structure.clear()
             st.success("Structure updated successfully!", icon=":material/check_circle:")
         else:
             st.error("Failed to update structure.", icon=":material/error:")
\ No newline at end of file
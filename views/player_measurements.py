@@ -29,6 +29,7 @@ import pandas as pd
 
 from utils.team_selector import team_selector
 from utils.ui_utils import get_table_height
+from utils.data_cache import load_roster
 from utils.constants import TEAMS
 from db.repositories.player_measurements_repo import PlayerMeasurementsRepository
 from db.errors import DatabaseError
@@ -56,7 +57,7 @@ def render(mongo, user: str | None = None) -> None:
 
     # --- Load roster for table ---
     try:
-        roster = mongo.get_player_names(team=team, style="LAST_FIRST")  # [{player_id, name}]
+        roster, _ = load_roster(mongo, team)  # [{player_id, display_name}]
     except DatabaseError as e:
         st.error(f"Failed to load roster: {e}")
         return
@@ -97,14 +98,15 @@ def render(mongo, user: str | None = None) -> None:
     if st.button("Save measurements", type="primary", icon=":material/save:"):
         try:
             entries: List[Dict[str, Any]] = []
-            for _, row in edited_df.iterrows():
-                pid = str(row["player_id"])
-                pname = str(row["player_name"])
-                absent = bool(row["absent"])
+            rows = edited_df[["player_id", "player_name", "height_cm", "weight_kg", "absent"]]
+            for pid, pname, height, weight, absent in rows.itertuples(index=False, name=None):
+                pid = str(pid)
+                pname = str(pname)
+                absent = bool(absent)
 
                 # Normalize values
-                height_val = None if pd.isna(row["height_cm"]) else int(row["height_cm"])
-                weight_val = None if pd.isna(row["weight_kg"]) else round(float(row["weight_kg"]), 1)
+                height_val = None if pd.isna(height) else int(height)
+                weight_val = None if pd.isna(weight) else round(float(weight), 1)
 
                 # If absent, override measurements to None
                 if absent:
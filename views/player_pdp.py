@@ -1,15 +1,60 @@
 import streamlit as st
 import pandas as pd
-from datetime import datetime
-from copy import deepcopy
+from datetime import datetime, timezone
 from streamlit.column_config import TextColumn, SelectboxColumn, CheckboxColumn
 
 from utils.ui_utils import get_table_height
+from utils.data_cache import load_roster, load_pdp_structure
 from utils.team_selector import team_selector
 from utils.constants import TEAMS  # e.g., ["U18", "U21"]
 
 from db.errors import DatabaseError, ApplicationError  # if you surface errors
 
+# score mapping for UI labels
+LABEL_TO_SCORE = {
+    "1 - Poor": 1,
+    "2 - Fair": 2,
+    "3 - Good": 3,
+    "4 - Very Good": 4,
+    "5 - Excellent": 5,
+}
+SCORE_TO_LABEL = {v: k for k, v in LABEL_TO_SCORE.items()}
+SCORE_OPTIONS = list(LABEL_TO_SCORE)
+
+# static editor config, shared by every category table
+PDP_COLUMN_CONFIG = {
+    "subcategory": TextColumn("Subcategory", disabled=True, width="medium"),
+    "topic": TextColumn("Topic", disabled=True, width="large"),
+    "score": SelectboxColumn("Score (1–5)", options=SCORE_OPTIONS, width="medium"),
+    "priority": CheckboxColumn("Priority", width="small"),
+    "comment": TextColumn("Comment", width="large"),
+}
+
+
+@st.cache_data(ttl=300, show_spinner=False)
+def _active_structure(team: str, version: int, _structure: dict) -> dict:
+    """Return the team structure restricted to active topics.
+
+    Subcategories without active topics, and categories left empty by that,
+    are dropped so no tab is opened for them. Cached per (team, structure
+    version); `_structure` is not hashed, the version is bumped on every
+    structure save. The TTL (same as `load_pdp_structure`) covers edits made
+    outside PDP Structure Management that do not bump the version.
+    """
+    active = {
+        category: {
+            subcat: [t for t in topics if t.get("active")]
+            for subcat, topics in subcats.items()
+        }
+        for category, subcats in _structure.items()
+    }
+    return {
+        category: {subcat: topics for subcat, topics in subcats.items() if topics}
+        for category, subcats in active.items()
+        if any(subcats.values())
+    }
+
+
 def render(mongo, user):
     st.title(":material/portrait: Create New Player PDP")
 
@@ -21,7 +66,7 @@ def render(mongo, user):
 
     # --- Load roster (standardized) ---
     try:
-        roster = mongo.get_player_names(team=team, style="LAST_FIRST", include_inactive=True)
+        roster, _ = load_roster(mongo, team, include_inactive=True)
     except (DatabaseError, ApplicationError) as e:
         st.error(f"Failed to load roster: {e}")
         return
@@ -36,7 +81,9 @@ def render(mongo, user):
     if "pdp_form_data" not in st.session_state:
         st.session_state["pdp_form_data"] = {}
 
-    form_data = deepcopy(st.session_state["pdp_form_data"])
+    # Two-level shallow copy: edited subcategories are rebuilt as new dicts below,
+    # so the stored topic entries are never mutated and no deepcopy is needed.
+    form_data = {cat: dict(subcats) for cat, subcats in st.session_state["pdp_form_data"].items()}
 
     col1, col2 = st.columns([4, 2])
     with col1:
@@ -53,7 +100,7 @@ def render(mongo, user):
         with bcol2:
             if st.button("Load last", use_container_width=True, icon=":material/file_open:"):
                 try:
-                    latest = mongo.get_latest_pdp_for_player(player_id)
+                    latest = mongo.get_latest_pdp_for_player(player_id, fields=["payload"])
                 except (DatabaseError, ApplicationError) as e:
                     st.error(f"Failed to load latest PDP: {e}")
                     latest = None
@@ -67,7 +114,7 @@ def render(mongo, user):
 
     # --- Load team PDP structure ---
     try:
-        structure_doc = mongo.get_pdp_structure_for_team(team)
+        structure_doc = load_pdp_structure(mongo, team)
     except (DatabaseError, ApplicationError) as e:
         st.error(f"Failed to load PDP structure: {e}")
         return
@@ -76,7 +123,10 @@ def render(mongo, user):
         st.error(f"No PDP structure found for team {team}")
         return
 
-    structure = structure_doc["structure"]
+    structure = _active_structure(team, structure_doc.get("version", 1), structure_doc["structure"])
+    if not structure:
+        st.info(f"No active PDP topics for team {team}.", icon=":material/info:")
+        return
 
     # --- PDP Form ---
     with st.form("pdp_form"):
@@ -89,76 +139,58 @@ def render(mongo, user):
                 if category not in form_data:
                     form_data[category] = {}
 
-                # subcategories inside the category
-                for subcat, topics in structure[category].items():
-                    # only active topics
-                    active_topics = [t for t in topics if t.get("active")]
-                    if not active_topics:
-                        continue
-
-                    st.markdown(f"**{subcat}**")
-                    if subcat not in form_data[category]:
-                        form_data[category][subcat] = {}
-
-                    # build editable table rows
-                    rows = []
+                # one editor per category; subcategory is a read-only column
+                rows = []
+                for subcat, active_topics in structure[category].items():
+                    stored = form_data[category].get(subcat, {})
                     for topic in active_topics:
                         topic_name = topic["name"]
-                        current = form_data[category][subcat].get(
+                        current = stored.get(
                             topic_name, {"score": 3, "priority": False, "comment": ""}
                         )
                         rows.append({
+                            "subcategory": subcat,
                             "topic": topic_name,
                             "score": current.get("score", 3),
                             "priority": bool(current.get("priority", False)),
                             "comment": current.get("comment", ""),
                         })
 
-                    # score mapping for UI labels
-                    label_to_score = {
-                        "1 - Poor": 1,
-                        "2 - Fair": 2,
-                        "3 - Good": 3,
-                        "4 - Very Good": 4,
-                        "5 - Excellent": 5,
-                    }
-                    score_to_label = {v: k for k, v in label_to_score.items()}
-
-                    # present scores as labels in the editor
-                    for row in rows:
-                        row["score"] = score_to_label.get(row["score"], "3 - Good")
-
-                    df = pd.DataFrame(rows)
-                    edited_df = st.data_editor(
-                        df,
-                        key=f"editor_{team}_{player_id}_{category}_{subcat}",
-                        use_container_width=True,
-                        column_config={
-                            "topic": TextColumn("Topic", disabled=True, width="large"),
-                            "score": SelectboxColumn("Score (1–5)", options=list(label_to_score.keys()), width="medium"),
-                            "priority": CheckboxColumn("Priority", width="small"),
-                            "comment": TextColumn("Comment", width="large"),
-                        },
-                        height=get_table_height(len(df)),
-                        hide_index=True,
-                    )
-
-                    # map labels back to numeric
-                    edited_df["score"] = edited_df["score"].map(label_to_score)
-
-                    # persist into form_data (session_state-backed)
-                    for _, row in edited_df.iterrows():
-                        form_data[category][subcat][row["topic"]] = {
-                            "score": int(row["score"]),
-                            "priority": bool(row["priority"]),
-                            "comment": str(row["comment"]).strip(),
-                        }
+                # present scores as labels in the editor
+                df = pd.DataFrame(rows)
+                df["score"] = df["score"].map(SCORE_TO_LABEL).fillna(SCORE_TO_LABEL[3])
+                edited_df = st.data_editor(
+                    df,
+                    # player_id stays in the key: a keyed editor keeps its cell edits when
+                    # its data changes, which would carry edits over to the next player
+                    key=f"editor_{team}_{player_id}_{category}",
+                    use_container_width=True,
+                    column_config=PDP_COLUMN_CONFIG,
+                    height=get_table_height(len(df)),
+                    hide_index=True,
+                )
+
+                # map labels back to numeric and normalize types in one vectorized pass
+                scored = edited_df.assign(
+                    score=edited_df["score"].map(LABEL_TO_SCORE).astype(int),
+                    priority=edited_df["priority"].astype(bool),
+                    comment=edited_df["comment"].fillna("").astype(str).str.strip(),
+                )
+
+                # persist into form_data (assigned to session_state on save)
+                edited: dict = {}
+                for subcat, topic, score, priority, comment in scored[
+                    ["subcategory", "topic", "score", "priority", "comment"]
+                ].itertuples(index=False, name=None):
+                    edited.setdefault(subcat, {})[topic] = {"score": score, "priority": priority, "comment": comment}
+                for subcat, topics in edited.items():
+                    form_data[category][subcat] = {**form_data[category].get(subcat, {}), **topics}
 
         # --- Save PDP ---
         submitted = st.form_submit_button("Save PDP", type="primary", icon=":material/save:")
         if submitted:
             try:
-                now = datetime.utcnow()
+                now = datetime.now(timezone.utc)
                 created_by = user if isinstance(user, str) else getattr(user, "name", str(user))
 
                 new_pdp = {
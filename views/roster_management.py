@@ -18,22 +18,41 @@ from typing import Any, Optional  # add this
 
 import streamlit as st
 import pandas as pd
+import numpy as np
 from datetime import datetime
 from db.mongo_wrapper import DatabaseError
 from utils.team_selector import team_selector
 from utils.ui_utils import get_table_height
+from utils.data_cache import load_roster
 
 from utils.constants import TEAMS
 
+def _cell_value(value: Any) -> Any:
+    """Editor cell -> Mongo value: a cleared cell becomes None, numpy scalars become Python."""
+    if pd.api.types.is_scalar(value) and pd.isna(value):
+        return None
+    return value.item() if isinstance(value, np.generic) else value
+
+
+# Static editor config (built once at import, not on every rerun)
+ROSTER_COLUMN_CONFIG = {
+    "player_id": st.column_config.NumberColumn(
+        "Player ID", required=True, format="%i", disabled=True
+    ),
+    "player_last_name": st.column_config.TextColumn("Last Name", required=True),
+    "player_first_name": st.column_config.TextColumn("First Name", required=True),
+    # ⚠️ don't include "team" here since we drop that column in the editor view
+}
 
 def render(mongo: Any, user: Optional[dict[str, Any]]) -> None:
     """Render the Roster Management page (edit-only; no adds/deletes).
 
     Loads the roster via `mongo.get_roster_df()`, presents an edit table with
     `player_id` disabled, and saves **only if** the set of player IDs is unchanged.
+    Only rows that differ from the loaded roster are written back.
 
     Args:
-        mongo: Database wrapper providing `get_roster_df()` and `save_roster_df()`.
+        mongo: Database wrapper providing `get_roster_df()` and `update_roster_rows()`.
         user: Authenticated user context (not used here but kept for consistency).
 
     Returns:
@@ -73,7 +92,7 @@ def render(mongo: Any, user: Optional[dict[str, Any]]) -> None:
     # Capture ORIGINAL ids for this team (used in save validation)
     original_ids = set(
         pd.to_numeric(team_roster_df.get("player_id", pd.Series(dtype="Int64")), errors="coerce")
-        .astype("Int64").dropna().astype(int)
+        .dropna().astype(int)
     )
 
     # Prepare the dataframe for the editor (hide 'team' in UI)
@@ -85,14 +104,7 @@ def render(mongo: Any, user: Optional[dict[str, Any]]) -> None:
         edited_df = st.data_editor(
             df_view,
             key=f"roster_editor_{team}",
-            column_config={
-                "player_id": st.column_config.NumberColumn(
-                    "Player ID", required=True, format="%i", disabled=True
-                ),
-                "player_last_name": st.column_config.TextColumn("Last Name", required=True),
-                "player_first_name": st.column_config.TextColumn("First Name", required=True),
-                # ⚠️ don't include "team" here since we dropped that column in df_view
-            },
+            column_config=ROSTER_COLUMN_CONFIG,
             height=get_table_height(len(df_view)),
             num_rows="fixed",              # 🚫 prevent adding/removing rows
             use_container_width=True,
@@ -102,11 +114,11 @@ def render(mongo: Any, user: Optional[dict[str, Any]]) -> None:
 
         if submitted:
             try:
+                # Coerce ids once; reused by every check below
+                edited_pids = pd.to_numeric(edited_df["player_id"], errors="coerce")
+
                 # ---- Safety: no add/remove (same policy as before) ----
-                edited_ids = set(
-                    pd.to_numeric(edited_df["player_id"], errors="coerce")
-                    .astype("Int64").dropna().astype(int)
-                )
+                edited_ids = set(edited_pids.dropna().astype(int))
                 if edited_ids != original_ids:
                     st.error(
                         "Player additions/removals are not allowed here. "
@@ -116,35 +128,52 @@ def render(mongo: Any, user: Optional[dict[str, Any]]) -> None:
                     st.stop()
 
                 # ---- Safety: no duplicate IDs within this team ----
-                if edited_df["player_id"].duplicated(keep=False).any():
-                    dups = edited_df["player_id"][edited_df["player_id"].duplicated(keep=False)].tolist()
+                dup_mask = edited_pids.duplicated(keep=False)
+                if dup_mask.any():
+                    dups = edited_pids[dup_mask].dropna().astype(int)
                     st.error(f"Duplicate player_id(s) in the table: {sorted(set(dups))}", icon=":material/error_outline:")
                     st.stop()
 
                 # ---- Row-level validation ----
-                req_cols = ["player_first_name", "player_last_name"]
-                missing_any = any(
-                    edited_df[c].isna().any() or (edited_df[c].astype(str).str.strip() == "").any()
-                    for c in req_cols if c in edited_df.columns
-                )
+                req_cols = [c for c in ("player_first_name", "player_last_name") if c in edited_df.columns]
+                names = edited_df[req_cols].fillna("").astype(str).apply(lambda col: col.str.strip())
+                missing_any = (names == "").to_numpy().any()
                 if missing_any:
                     st.error("Empty values detected. Please complete all required name fields.", icon=":material/error_outline:")
                     st.stop()
 
-                # ---- Reattach correct team & coerce types ----
-                to_save = edited_df.copy()
-                to_save["team"] = team
-                to_save["player_id"] = pd.to_numeric(to_save["player_id"], errors="coerce").astype("Int64")
-                if to_save["player_id"].isna().any():
+                if edited_pids.isna().any():
                     st.error("One or more player_id values are invalid.", icon=":material/error_outline:")
                     st.stop()
 
-                # ---- Team-scoped replace ----
-                ok = mongo.save_roster_df(to_save, team=team)
-                if ok:
-                    st.success(f"Roster for {team} updated.", icon=":material/check_box:")
-                else:
-                    st.error("Failed to save roster.", icon=":material/error_outlin:")
+                # ---- Only send rows that differ from the loaded roster ----
+                edited_cmp = edited_df.set_index(edited_pids.to_numpy()).astype(object)
+                original_cmp = (
+                    df_view.set_index(pd.to_numeric(df_view["player_id"], errors="coerce").to_numpy())
+                    .reindex(index=edited_cmp.index, columns=edited_cmp.columns)
+                    .astype(object)
+                )
+                cell_diff = (edited_cmp.ne(original_cmp) & ~(edited_cmp.isna() & original_cmp.isna())).to_numpy()
+                differs = cell_diff.any(axis=1)
+                if not differs.any():
+                    st.info("No changes to save.", icon=":material/info:")
+                    st.stop()
+
+                # ---- (player_id, {changed column: new value}) straight from the per-cell diff ----
+                columns = list(edited_df.columns)
+                updates = [
+                    (int(pid), {col: _cell_value(row[j]) for j, col in enumerate(columns) if mask[j]})
+                    for pid, row, mask in zip(
+                        edited_pids[differs].astype(int),
+                        edited_df[differs].to_numpy(dtype=object),
+                        cell_diff[differs],
+                    )
+                ]
+
+                # ---- Team-scoped targeted update ----
+                mongo.update_roster_rows(updates, team=team)
+                load_roster.clear()
+                st.success(f"Roster for {team} updated ({len(updates)} player(s) changed).", icon=":material/check_box:")
 
             except DatabaseError as e:
                 st.error(str(e))
@@ -1,7 +1,24 @@
 # views/admin_data_quality_rpe.py
+import io
+
+import pandas as pd
 import streamlit as st
 from services.rpe_quality_service import season_rpe_quality
 
+
+@st.cache_data(show_spinner=False)
+def _df_to_csv_bytes(df: pd.DataFrame) -> bytes:
+    """Serialize a table to CSV bytes once; reruns with an unchanged frame hit the cache."""
+    buf = io.BytesIO()
+    df.to_csv(buf, index=False)
+    return buf.getvalue()
+
+@st.cache_data(ttl=300, show_spinner=False)
+def _season_quality(_mongo, team: str, exempt_key: tuple | None) -> dict:
+    """Cached `season_rpe_quality` keyed on team + exempt override (None = constants.EXEMPT)."""
+    exempt = list(exempt_key) if exempt_key is not None else None
+    return season_rpe_quality(_mongo, team=team, exempt_player_ids=exempt)
+
 def render(mongo, user):
     """
     Render the **RPE Data Quality** admin view in the Streamlit app.
@@ -50,7 +67,7 @@ def render(mongo, user):
     override = st.text_input("Exempt player IDs (comma separated)", value="") if use_override else ""
     exempt_ids = [x.strip() for x in override.split(",") if x.strip()] if use_override else None
 
-    res = season_rpe_quality(mongo, team=team, exempt_player_ids=exempt_ids)
+    res = _season_quality(mongo, team, tuple(exempt_ids) if exempt_ids is not None else None)
 
     c1, c2, c3, c4 = st.columns(4)
     c1.metric("Team Compliance %", res["summary"]["team_compliance_pct"])
@@ -71,7 +88,7 @@ def render(mongo, user):
     st.subheader("Anomalies")
     st.dataframe(res["anomalies_df"], use_container_width=True, hide_index=True) if not res["anomalies_df"].empty else st.success("No anomaly rows 🎉")
 
-    # # CSV exports
-    # st.download_button("Download Compliance (CSV)", res["compliance_df"].to_csv(index=False), file_name=f"rpe_compliance_{team}_season.csv", mime="text/csv")
-    # st.download_button("Download Duplicates (CSV)", res["duplicates_df"].to_csv(index=False), file_name=f"rpe_duplicates_{team}_season.csv", mime="text/csv")
-    # st.download_button("Download Anomalies (CSV)", res["anomalies_df"].to_csv(index=False), file_name=f"rpe_anomalies_{team}_season.csv", mime="text/csv")
\ No newline at end of file
+    # CSV exports
+    st.download_button("Download Compliance (CSV)", _df_to_csv_bytes(res["compliance_df"]), file_name=f"rpe_compliance_{team}_season.csv", mime="text/csv")
+    st.download_button("Download Duplicates (CSV)", _df_to_csv_bytes(res["duplicates_df"]), file_name=f"rpe_duplicates_{team}_season.csv", mime="text/csv")
+    st.download_button("Download Anomalies (CSV)", _df_to_csv_bytes(res["anomalies_df"]), file_name=f"rpe_anomalies_{team}_season.csv", mime="text/csv")
\ No newline at end of file
@@ -1,9 +1,10 @@
 import streamlit as st
 import pandas as pd
+import plotly.graph_objects as go
 from datetime import date
 
 from utils.team_selector import team_selector
-from utils.constants import TEAMS
+from utils.constants import TEAMS, SESSION_TYPE_STYLES
 from db.errors import DatabaseError, ApplicationError
 
 # from db.repositories.session_dashboard_repo import (
@@ -22,39 +23,91 @@ from charts.session_dashboard_graphs import (
 
 from db.repositories.session_dashboard_repo import SessionsDashboardRepository
 
+
+def _with_categoricals(df: pd.DataFrame) -> pd.DataFrame:
+    """Store session_type (ordered as SESSION_TYPE_STYLES) and team as categoricals.
+
+    Unknown session types are appended as extra categories instead of becoming NaN.
+    """
+    if df.empty:
+        return df
+    if "session_type" in df.columns:
+        known = list(SESSION_TYPE_STYLES)
+        extra = sorted(set(df["session_type"].dropna().astype(str)) - set(known))
+        df["session_type"] = pd.Categorical(df["session_type"], categories=known + extra, ordered=True)
+    if "team" in df.columns:
+        df["team"] = df["team"].astype("category")
+    return df
+
 # ✅ Underscore the unhashable argument here
 @st.cache_data(show_spinner=False)
 def _load_aggregates(_mongo, team: str) -> pd.DataFrame:
     """Load session aggregates via SessionsDashboardRepo."""
     repo = SessionsDashboardRepository(_mongo)
-    return repo.get_session_rpe_aggregates_df(team)
+    return _with_categoricals(repo.get_session_rpe_aggregates_df(team))
 
 
 @st.cache_data(show_spinner=False)
 def _load_rpe_per_session(
     _mongo,
     team: str,
-    use_range: bool,
     dt_from: date | None,
     dt_to: date | None
 ) -> pd.DataFrame:
-    """Load per-session RPE data via SessionsDashboardRepo."""
+    """Load per-session RPE data via SessionsDashboardRepo (None bounds = no date filter)."""
     repo = SessionsDashboardRepository(_mongo)
-    return repo.get_rpe_joined_per_session_df(
+    return _with_categoricals(repo.get_rpe_joined_per_session_df(
         team=team,
-        date_from=dt_from if use_range else None,
-        date_to=dt_to if use_range else None,
-    )
+        date_from=dt_from,
+        date_to=dt_to,
+    ))
 
 
-def render(mongo, user):
-    st.title(":material/timer: Session RPE Dashboard")
+@st.cache_data(show_spinner=False)
+def _rpe_boxplot_figure(
+    _mongo,
+    team: str,
+    dt_from: date | None,
+    dt_to: date | None
+) -> go.Figure:
+    """Per-session RPE boxplot, built once per (team, date filter)."""
+    rpe_df = _load_rpe_per_session(_mongo, team, dt_from, dt_to)
+    return rpe_boxplot_per_session(rpe_df, title=f"RPE Distribution per Session ({team})")
+
+
+@st.cache_data(show_spinner=False)
+def _rpe_outliers(
+    _mongo,
+    team: str,
+    dt_from: date | None,
+    dt_to: date | None,
+    iqr_k: float = 1.5
+) -> pd.DataFrame:
+    """Per-session IQR outliers, computed once per (team, date filter, k)."""
+    rpe_df = _load_rpe_per_session(_mongo, team, dt_from, dt_to)
+    return rpe_outliers_table(rpe_df, iqr_k=iqr_k)
+
+
+@st.cache_data(show_spinner=False)
+def _aggregate_figures(_mongo, team: str) -> tuple[go.Figure, go.Figure, go.Figure] | None:
+    """The three aggregate load charts, built once per team (None when there is no data)."""
+    agg_df = _load_aggregates(_mongo, team)
+    if agg_df.empty:
+        return None
+    return (
+        bar_avg_load_per_type(agg_df, title="Average Load per Session Type"),
+        stacked_load_per_week(agg_df, title="Load Distribution by Session Type (per Week)"),
+        stacked_pct_load_per_week(agg_df, title="Relative Load Distribution by Session Type per Week (100% Stacked)"),
+    )
 
-    team = team_selector(TEAMS)
-    if not team:
-        st.info("Select a team to continue.", icon=":material/info:")
-        return
 
+@st.fragment
+def _rpe_fragment(mongo, team: str) -> None:
+    """Date filter + per-session RPE boxplot and outliers.
+
+    Runs as a fragment: changing the date range reruns only this block, not the
+    aggregate charts below it.
+    """
     c1, c2, c3 = st.columns([1, 1, 1])
     with c1:
         use_range = st.toggle("Filter by date range", value=False)
@@ -63,10 +116,12 @@ def render(mongo, user):
     with c3:
         dt_to = st.date_input("To", value=date.today(), disabled=not use_range)
 
+    # Without a range the (disabled) date inputs must not be part of the cache key
+    if not use_range:
+        dt_from = dt_to = None
+
     try:
-        # ✅ You still call with `mongo` here
-        agg_df = _load_aggregates(mongo, team)
-        rpe_df = _load_rpe_per_session(mongo, team, use_range, dt_from, dt_to)
+        rpe_df = _load_rpe_per_session(mongo, team, dt_from, dt_to)
     except DatabaseError as e:
         st.error(str(e), icon=":material/error:")
         return
@@ -80,44 +135,60 @@ def render(mongo, user):
         st.info("No per-session RPE data for the selected filters.")
     else:
         st.plotly_chart(
-            rpe_boxplot_per_session(rpe_df, title=f"RPE Distribution per Session ({team})"),
+            _rpe_boxplot_figure(mongo, team, dt_from, dt_to),
             use_container_width=True
         )
 
-    # ---- Charts: your existing KPIs ---------------------------------------
-    #st.subheader(":material/bar_chart: Average Load per Session Type")
-    if agg_df.empty:
-        st.info("No aggregate data found.")
-        return
-
-    st.plotly_chart(
-        bar_avg_load_per_type(agg_df, title="Average Load per Session Type"),
-        use_container_width=True
-    )
-
-    #st.subheader(":material/stacked_bar_chart: Load Distribution by Session Type (per Week)")
-    st.plotly_chart(
-        stacked_load_per_week(agg_df, title="Load Distribution by Session Type (per Week)"),
-        use_container_width=True
-    )
-
-    #st.subheader(":material/percent: Relative Load Distribution by Session Type per Week (100% Stacked)")
-    st.plotly_chart(
-        stacked_pct_load_per_week(agg_df, title="Relative Load Distribution by Session Type per Week (100% Stacked)"),
-        use_container_width=True
-    )
-
     # ---- Outliers table ----------------------------------------------------
     st.subheader(":material/flag: RPE Outliers per Session (IQR × 1.5)")
     if rpe_df.empty:
         st.info("No outliers to display.")
     else:
-        out = rpe_outliers_table(rpe_df, iqr_k=1.5)
+        out = _rpe_outliers(mongo, team, dt_from, dt_to, iqr_k=1.5)
         if out.empty:
             st.success("No outliers detected.")
         else:
+            # rows arrive sorted by date, session_type, session_id, player_id from the query
             st.dataframe(
-                out.sort_values(["date", "session_type", "session_id", "player_id"]),
+                out,
                 use_container_width=True,
                 height=400
-            )
\ No newline at end of file
+            )
+
+
+def render(mongo, user):
+    st.title(":material/timer: Session RPE Dashboard")
+
+    team = team_selector(TEAMS)
+    if not team:
+        st.info("Select a team to continue.", icon=":material/info:")
+        return
+
+    # ---- Date-filtered RPE block (fragment) -------------------------------
+    _rpe_fragment(mongo, team)
+
+    try:
+        # ✅ You still call with `mongo` here
+        agg_figs = _aggregate_figures(mongo, team)
+    except DatabaseError as e:
+        st.error(str(e), icon=":material/error:")
+        return
+    except Exception as e:
+        st.error(f"Unexpected error: {e}", icon=":material/error:")
+        return
+
+    # ---- Charts: your existing KPIs ---------------------------------------
+    if agg_figs is None:
+        st.info("No aggregate data found.")
+        return
+
+    avg_fig, stacked_fig, stacked_pct_fig = agg_figs
+
+    #st.subheader(":material/bar_chart: Average Load per Session Type")
+    st.plotly_chart(avg_fig, use_container_width=True)
+
+    #st.subheader(":material/stacked_bar_chart: Load Distribution by Session Type (per Week)")
+    st.plotly_chart(stacked_fig, use_container_width=True)
+
+    #st.subheader(":material/percent: Relative Load Distribution by Session Type per Week (100% Stacked)")
+    st.plotly_chart(stacked_pct_fig, use_container_width=True)
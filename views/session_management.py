@@ -17,6 +17,7 @@ Import safety:
 from __future__ import annotations
 from typing import Any, Optional  # add this
 
+import json
 import streamlit as st
 from datetime import date
 import pandas as pd
@@ -31,6 +32,73 @@ from utils.calendar_view import (
     render_legend,
 )
 
+
+def _json_default(obj: Any) -> Any:
+    """Unwrap numpy/pandas scalars (e.g. int64 durations) for json.dumps."""
+    return obj.item() if hasattr(obj, "item") else str(obj)
+
+
+@st.cache_resource(ttl=300, show_spinner=False)
+def _load_events(_mongo: Any, team: str) -> list[dict[str, Any]]:
+    """Team sessions as FullCalendar events, built once per team.
+
+    Events are reduced to plain JSON types once here, and `cache_resource` hands
+    back the same (read-only) list on every rerun instead of unpickling a copy.
+    Cleared after a session is added here; the 5-minute TTL picks up sessions
+    changed elsewhere (e.g. directly in MongoDB).
+    """
+    try:
+        df = _mongo.get_sessions_df(team=team)
+    except AttributeError:
+        # Fallback if you only have a list API
+        docs = _mongo.get_sessions(team=team)  # list[dict]
+        df = pd.DataFrame(docs) if docs else pd.DataFrame()
+    return json.loads(json.dumps(sessions_df_to_events(df), default=_json_default))
+
+
+@st.fragment
+def _calendar_fragment(mongo: Any) -> None:
+    """Render the calendar block (team filter, calendar, click handling).
+
+    Runs as a fragment: team filter changes and calendar clicks rerun only this
+    block, not the New Session form above it.
+    """
+    st.subheader("Calendar")
+
+    if "selected_team" not in st.session_state:
+        st.session_state["selected_team"] = "U18"
+
+    team = team_selector(TEAMS, session_key="selected_team", widget_key="team_selector_calendar")
+    if not team:
+        st.info("Select a team to continue.", icon=":material/info:")
+        return
+    
+    st.session_state["selected_team"] = team
+    
+    # Fetch sessions and convert them to calendar events (cached per team)
+    try:
+        events = _load_events(mongo, team)
+    except Exception as e:
+        st.error(f"Failed to load sessions: {e}")
+        return
+
+    state = render_calendar(
+        events=events,
+        key=f"calendar_{team}",
+        options=None,  # use defaults; supply your own dict to override
+    )
+
+    # Optional: react to interactions
+    if state.get("callback") == "dateClick":
+        clicked = state["dateClick"]["dateStr"]  # 'YYYY-MM-DD'
+        st.info(f"Clicked date: {clicked}")
+    elif state.get("callback") == "eventClick":
+        evt = state["eventClick"]["event"]
+        st.info(f"Selected: {evt.get('title','Session')}")
+        with st.expander("Event details"):
+            st.json(evt)
+
+
 def render(mongo: Any, user: Optional[dict[str, Any]]) -> None:
     """Render the Session Management admin page.
 
@@ -99,6 +167,7 @@ def render(mongo: Any, user: Optional[dict[str, Any]]) -> None:
             try:
                 if mongo.add_session(session):
                     st.success("Session added!", icon=":material/check_box:")
+                    _load_events.clear()
                     st.rerun()  # refresh the calendar immediately
                 else:
                     st.error("Failed to add session.", icon=":material/error_outline:")
@@ -106,47 +175,4 @@ def render(mongo: Any, user: Optional[dict[str, Any]]) -> None:
                 st.error(f"Error adding session: {e}")
 
     # --- Calendar View -------------------------------------------------------
-    st.subheader("Calendar")
-
-    if "selected_team" not in st.session_state:
-        st.session_state["selected_team"] = "U18"
-
-    team = team_selector(TEAMS, session_key="selected_team", widget_key="team_selector_calendar")
-    if not team:
-        st.info("Select a team to continue.", icon=":material/info:")
-        return
-    
-    st.session_state["selected_team"] = team
-    
-    # Fetch sessions as DataFrame (use your existing wrapper)
-    try:
-        df = mongo.get_sessions_df(team=team)
-    except AttributeError:
-        # Fallback if you only have a list API
-        try:
-            docs = mongo.get_sessions(team=team)  # list[dict]
-            df = pd.DataFrame(docs) if docs else pd.DataFrame()
-        except Exception as e:
-            st.error(f"Failed to load sessions: {e}")
-            return
-    except Exception as e:
-        st.error(f"Failed to load sessions: {e}")
-        return
-
-    events = sessions_df_to_events(df)
-
-    state = render_calendar(
-        events=events,
-        key=f"calendar_{team}",
-        options=None,  # use defaults; supply your own dict to override
-    )
-
-    # Optional: react to interactions
-    if state.get("callback") == "dateClick":
-        clicked = state["dateClick"]["dateStr"]  # 'YYYY-MM-DD'
-        st.info(f"Clicked date: {clicked}")
-    elif state.get("callback") == "eventClick":
-        evt = state["eventClick"]["event"]
-        st.info(f"Selected: {evt.get('title','Session')}")
-        with st.expander("Event details"):
-            st.json(evt)
\ No newline at end of file
+    _calendar_fragment(mongo)
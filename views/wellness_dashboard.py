@@ -2,9 +2,40 @@ import streamlit as st
 import plotly.express as px
 from utils.ui_utils import get_table_height
 from utils.team_selector import team_selector
+from utils.data_cache import load_roster
 from utils.constants import TEAMS
 from datetime import datetime, date
 import pandas as pd
+import numpy as np
+
+# Today's Check table: values stay numeric, the traffic-light icon gets its own narrow column
+TODAY_COLUMN_CONFIG = {
+    "Player": st.column_config.TextColumn("Player"),
+    "wellness_icon": st.column_config.TextColumn("", width="small"),
+    "Wellness": st.column_config.NumberColumn("Wellness", format="%d"),
+    "sleep_icon": st.column_config.TextColumn("", width="small"),
+    "Sleep Hours": st.column_config.NumberColumn("Sleep Hours"),
+    "Submitted At": st.column_config.TextColumn("Submitted At"),
+}
+
+
+@st.cache_data(ttl=30, show_spinner=False)
+def _load_today_entries(_mongo, team: str) -> list:
+    """Today's wellness entries for a team; short TTL so new submissions show up quickly."""
+    return _mongo.get_today_wellness_entries(team)
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _wellness_matrix(_mongo, team: str) -> pd.DataFrame:
+    """Weekly wellness averages for a team, already rounded for display."""
+    return _mongo.get_wellness_matrix(team=team).round(2)
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _daily_wellness_overview(_mongo, team: str) -> pd.DataFrame:
+    """Player x date wellness overview for a team."""
+    return _mongo.get_daily_wellness_overview(team=team)
+
 
 def render(mongo, user):
     st.title(":material/monitor_heart: Wellness Dashboard")
@@ -26,60 +57,55 @@ def render(mongo, user):
                 st.info("Please select a team to view today's wellness entries.")
             else:
                 # Get wellness entries (player filtering is done inside the wrapper)
-                wellness_entries = mongo.get_today_wellness_entries(team)
-
-                # Get roster (only for display mapping)
-
-                # Get roster (for display mapping) — use standardized display_name
-                roster = mongo.get_player_names(team=team, style="LAST_FIRST", include_inactive=True)
-                player_map = {int(p["player_id"]): p["display_name"] for p in roster}
-
-                # roster = mongo.get_roster_players(team=team)
-                # player_map = {
-                #     int(p["player_id"]): f"{p['player_last_name']}, {p['player_first_name']}"
-                #     for p in roster
-                # }
-
-                # Build DataFrame
-                rows = []
-                for entry in wellness_entries:
-                    pid = entry["player_id"]
-                    name = player_map.get(pid, "Unknown")
-                    wellness = entry.get("feeling")
-                    sleep = entry.get("sleep_hours")
-                    timestamp = entry.get("timestamp")
-
-                    # Icons
-                    if wellness == 1:
-                        w_icon = "🔴"
-                    elif wellness in [2, 3]:
-                        w_icon = "🟠"
-                    elif wellness in [4, 5]:
-                        w_icon = "🟢"
-                    else:
-                        w_icon = "❓"
-
-                    if sleep is None:
-                        s_icon = "❓"
-                    elif sleep < 5:
-                        s_icon = "🔴"
-                    elif 5 <= sleep <= 7:
-                        s_icon = "🟠"
-                    else:
-                        s_icon = "🟢"
-
-                    rows.append({
-                        "Player": name,
-                        "Wellness": f"{w_icon} {wellness}",
-                        "Sleep Hours": f"{s_icon} {sleep}",
-                        "Submitted At": timestamp.strftime("%H:%M") if timestamp else "—"
-                    })
+                wellness_entries = _load_today_entries(mongo, team)
+
+                # Get roster (for display mapping) — cached id -> display_name map as a Series
+                # (built per run, so load_roster.clear() after a roster save takes effect at once)
+                _, player_map = load_roster(mongo, team, include_inactive=True)
+                player_names = pd.Series(player_map, dtype=object)
+
+                # Build DataFrame in one pass
+                entries = pd.DataFrame(
+                    wellness_entries,
+                    columns=["player_id", "feeling", "sleep_hours", "timestamp"],
+                    dtype=object,
+                )
+                wellness = pd.to_numeric(entries["feeling"], errors="coerce")
+                sleep = pd.to_numeric(entries["sleep_hours"], errors="coerce")
+
+                # Icons
+                w_icon = np.select(
+                    [wellness == 1, wellness.isin([2, 3]), wellness.isin([4, 5])],
+                    ["🔴", "🟠", "🟢"],
+                    default="❓",
+                )
+                s_icon = np.select(
+                    [sleep.isna(), sleep < 5, sleep <= 7],
+                    ["❓", "🔴", "🟠"],
+                    default="🟢",
+                )
 
-                df = pd.DataFrame(rows)
+                # Arrow-backed text + nullable numbers: st.dataframe ships them without re-inferring object columns
+                df = pd.DataFrame({
+                    "Player": entries["player_id"].map(player_names).fillna("Unknown").astype("string[pyarrow]"),
+                    "wellness_icon": pd.Series(w_icon, index=entries.index, dtype="string[pyarrow]"),
+                    "Wellness": wellness.astype("Float64"),
+                    "sleep_icon": pd.Series(s_icon, index=entries.index, dtype="string[pyarrow]"),
+                    "Sleep Hours": sleep.astype("Float64"),
+                    "Submitted At": (
+                        pd.to_datetime(entries["timestamp"], errors="coerce")
+                        .dt.strftime("%H:%M").fillna("—").astype("string[pyarrow]")
+                    ),
+                })
                 if df.empty:
                     st.info("No wellness entries submitted yet today for this team.")
                 else:
-                    st.dataframe(df, use_container_width=True, height=get_table_height(len(df)))
+                    st.dataframe(
+                        df,
+                        use_container_width=True,
+                        height=get_table_height(len(df)),
+                        column_config=TODAY_COLUMN_CONFIG,
+                    )
 
         except Exception as e:
             st.error(f":material/error: Error loading today's wellness tab: {e}")
@@ -89,12 +115,11 @@ def render(mongo, user):
         try:
             st.subheader(":material/date_range: Weekly Wellness Averages")
             
-            df = mongo.get_wellness_matrix(team=team)
+            df = _wellness_matrix(mongo, team)
             if df.empty:
                 st.info("No wellness data found.")
-                st.stop()
-            df = df.round(2)
-            st.dataframe(df, use_container_width=True, height=get_table_height(len(df)), hide_index=True)
+            else:
+                st.dataframe(df, use_container_width=True, height=get_table_height(len(df)), hide_index=True)
         except Exception as e:
             st.error(f":material/error: Error loading wellness data: {e}")
 
@@ -103,7 +128,7 @@ def render(mongo, user):
         st.subheader(":material/all_inclusive: All Wellness Entries")
 
         try:
-            pivot_df = mongo.get_daily_wellness_overview(team=team)
+            pivot_df = _daily_wellness_overview(mongo, team)
             if pivot_df.empty:
                 st.info("No wellness entries available.", icon=":material/info:")
             else:
@@ -111,14 +136,13 @@ def render(mongo, user):
                 # Parse columns to dates
                 col_dates = pd.to_datetime(pivot_df.columns, errors="coerce")
 
-                # Build week labels like "2025-W32" (ISO weeks: Mon–Sun)
-                week_labels = []
-                for d in col_dates:
-                    if pd.isna(d):
-                        week_labels.append(None)
-                    else:
-                        iso = d.isocalendar()  # (year, week, weekday)
-                        week_labels.append(f"{iso.year}-W{int(iso.week):02d}")
+                # Build week labels like "2025-W32" (ISO weeks: Mon–Sun; vectorized, NaT -> NaN)
+                iso = col_dates.isocalendar()
+                week_labels = (
+                    (iso["year"].astype(str) + "-W" + iso["week"].astype(str).str.zfill(2))
+                    .where(iso["week"].notna())
+                    .to_numpy()
+                )
 
                 # Map columns to week labels
                 meta = pd.DataFrame({
@@ -127,12 +151,8 @@ def render(mongo, user):
                     "week": week_labels,
                 }).dropna(subset=["week"])
 
-                # Unique weeks ordered by date
-                unique_weeks = (
-                    meta.sort_values("date")
-                        .drop_duplicates(subset=["week"])
-                        ["week"].tolist()
-                )
+                # Unique weeks in chronological order ("YYYY-Www" labels sort chronologically)
+                unique_weeks = np.unique(meta["week"].to_numpy(dtype=str)).tolist()
 
                 if not unique_weeks:
                     st.info("No dated columns to filter.")